@@ -4,78 +4,269 @@ CryptoHaven Backend API Testing Suite
 Tests all major API endpoints and workflows
 """
 
-import requests
+import os
 import sys
+import socket
+import argparse
 import json
 import time
-from datetime import datetime
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+TOKEN_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'tokens.json')
+
+def token_expiry(token):
+    """Read the exp claim from a JWT without verifying it"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that adds TCP keepalive to urllib3's default socket options (TCP_NODELAY)"""
+
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
 
 class CryptoHavenAPITester:
-    def __init__(self, base_url="http://localhost:8000"):
+    # Upper bound on in-flight requests so the dev server isn't overwhelmed
+    MAX_CONCURRENCY = 8
+    SUPPORTED_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE'})
+    # (connect, read) seconds, so a stalled server can't hang the suite
+    REQUEST_TIMEOUT = (2.0, 10.0)
+    # Seconds a passing health/API info check is reused across looped runs
+    CONNECTIVITY_CACHE_TTL = 30
+    # Cached tokens are dropped this many seconds before the JWT expires
+    TOKEN_EXPIRY_MARGIN = 60
+
+    # Sent with pre-encoded bodies; requests adds it itself for json=
+    JSON_HEADERS = {'Content-Type': 'application/json'}
+
+    # Constant request bodies, JSON-encoded once instead of on every call
+    PRE_ENCODED = {
+        'admin_login': json.dumps({
+            "email": "admin@cryptohaven.com",
+            "password": "SecureAdminPassword123!"
+        }).encode('utf-8'),
+        'invalid_login': json.dumps({
+            "email": "invalid@example.com",
+            "password": "wrongpassword"
+        }).encode('utf-8'),
+        'deposit': json.dumps({
+            "txid": "0xtest123456789",  # Made longer to meet minimum requirement
+            "chain": "ERC20",
+            "amount_usd": 100,
+            "coin": "USDT"
+        }).encode('utf-8'),
+        'investment': json.dumps({
+            "plan_id": "1",  # Fixed field name
+            "amount_usd": 50  # Fixed field name
+        }).encode('utf-8'),
+    }
+
+    def __init__(self, base_url="http://localhost:8000", session=None):
         self.base_url = base_url
-        self.access_token = None
+        # Any requests-compatible session can be injected, e.g. one with a
+        # custom transport adapter mounted for stress runs
+        # Only sessions built here are closed by close(); injected ones stay
+        # owned by the caller
+        self._owns_session = session is None
+        self.session = self._build_session() if self._owns_session else session
+        self.set_access_token(None)
         self.refresh_token = None
         self.user_id = None
-        self.admin_token = None
+        self.test_email = None
+        self.test_password = None
+        self.set_admin_token(None)
         self.tests_run = 0
         self.tests_passed = 0
-        self.test_results = []
+        self._names = []
+        self._passed = bytearray()
+        self._failure_details = {}
+        self._results_lock = threading.Lock()
+        self._log_buf = []
+        # Per-thread result buffer used while a test runs inside run_concurrently
+        self._local = threading.local()
+        self._connectivity_cache = {}
+        self._runs_started = 0
+
+    @staticmethod
+    def _build_session():
+        """Create the default keep-alive session"""
+        session = requests.Session()
+        session.mount('http://', TunedHTTPAdapter(pool_connections=4, pool_maxsize=16))
+        # HTTP/1.1 keeps connections alive by default, so this header is
+        # redundant. Content-Type is only sent with a body (see JSON_HEADERS).
+        session.headers.pop('Connection', None)
+        return session
+
+    def _read_token_cache(self):
+        """Load the on-disk token cache, treating a missing or corrupt file as empty"""
+        try:
+            with open(TOKEN_CACHE_PATH) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def load_cached_token(self, key):
+        """Return a cached token for this server if it has not expired"""
+        entry = self._read_token_cache().get(f"{self.base_url}|{key}")
+        if isinstance(entry, dict) and entry.get('expires_at', 0) > time.time():
+            return entry.get('token')
+        return None
+
+    def store_cached_token(self, key, token):
+        """Persist a token until shortly before it expires, or drop it when token is None"""
+        cache = self._read_token_cache()
+        cache_key = f"{self.base_url}|{key}"
+        expiry = token_expiry(token) if token else None
+        if expiry:
+            cache[cache_key] = {'token': token, 'expires_at': expiry - self.TOKEN_EXPIRY_MARGIN}
+        else:
+            cache.pop(cache_key, None)
+        
+        try:
+            os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{TOKEN_CACHE_PATH}.tmp"
+            # The cache holds bearer tokens, so keep it readable by the owner only
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, TOKEN_CACHE_PATH)
+        except OSError:
+            pass
 
     def log_test(self, name, success, details=""):
-        """Log test results"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {name} - PASSED")
+        """Log test results (buffered until flush_log so concurrent tests don't contend on stdout)"""
+        pending = getattr(self._local, 'pending', None)
+        if pending is not None:
+            # Inside a concurrent batch: run_concurrently records it in submission order
+            pending.append((name, success, details))
         else:
-            print(f"❌ {name} - FAILED: {details}")
+            self._record_result(name, success, details)
+
+    def _record_result(self, name, success, details):
+        """Count a result and append it to the log buffer and result columns"""
+        line = f"✅ {name} - PASSED" if success else f"❌ {name} - FAILED: {details}"
+        with self._results_lock:
+            self.tests_run += 1
+            if success:
+                self.tests_passed += 1
+            self._log_buf.append(line)
+            
+            # Parallel per-test columns; details are only kept for failures
+            if not success:
+                self._failure_details[len(self._names)] = details
+            self._names.append(name)
+            self._passed.append(1 if success else 0)
+
+    def flush_log(self):
+        """Write buffered test log lines to stdout in one call"""
+        with self._results_lock:
+            lines, self._log_buf = self._log_buf, []
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+
+    @classmethod
+    def _bearer_headers(cls, token):
+        """Build the (plain, JSON body) header dicts for a bearer token"""
+        if not token:
+            return None, cls.JSON_HEADERS
+        headers = {'Authorization': f'Bearer {token}'}
+        return headers, {**headers, **cls.JSON_HEADERS}
+
+    def set_access_token(self, token):
+        """Store the user access token and build its request headers once"""
+        self.access_token = token
+        self._user_headers, self._user_json_headers = self._bearer_headers(token)
+
+    def set_admin_token(self, token):
+        """Store the admin access token and build its request headers once"""
+        self.admin_token = token
+        self._admin_headers = self._bearer_headers(token)[0]
+
+    def make_request(self, method, endpoint, data=None, headers=None, expected_status=200, raw_body=None,
+                     require_success_flag=True):
+        """Make HTTP request over the shared keep-alive session (raw_body: pre-encoded JSON bytes)
+
+        headers is passed through as-is; callers use the dicts prebuilt by
+        set_access_token/set_admin_token, which include Content-Type for raw_body.
+
+        Success means the expected status and, when require_success_flag is set,
+        a truthy 'success' field in the response body.
+        """
+        if method not in self.SUPPORTED_METHODS:
+            return False, 0, {'error': f'Unsupported method: {method}'}
         
-        self.test_results.append({
-            'name': name,
-            'success': success,
-            'details': details,
-            'timestamp': datetime.now().isoformat()
-        })
-
-    def make_request(self, method, endpoint, data=None, token=None, expected_status=200):
-        """Make HTTP request with proper headers"""
         url = f"{self.base_url}/api/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        
-        if token:
-            headers['Authorization'] = f'Bearer {token}'
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers)
+            if raw_body is not None:
+                response = self.session.request(method, url, data=raw_body,
+                                                headers=headers or self.JSON_HEADERS,
+                                                timeout=self.REQUEST_TIMEOUT)
+            else:
+                # requests sets Content-Type itself when json is given
+                response = self.session.request(method, url, json=data, headers=headers,
+                                                timeout=self.REQUEST_TIMEOUT)
             
+            body = response.content
+            try:
+                parsed = json_loads(body) if body else {}
+            except ValueError:
+                parsed = {}
             success = response.status_code == expected_status
-            return success, response.status_code, response.json() if response.content else {}
+            if require_success_flag:
+                success = success and isinstance(parsed, dict) and bool(parsed.get('success'))
+            return success, response.status_code, parsed
             
         except Exception as e:
             return False, 0, {'error': str(e)}
 
+    def _connectivity_check(self, name, endpoint):
+        """GET a static endpoint, reusing a recent passing result instead of refetching"""
+        cached_at = self._connectivity_cache.get(endpoint)
+        if cached_at is not None and time.monotonic() - cached_at < self.CONNECTIVITY_CACHE_TTL:
+            # Label reused results so the output doesn't claim the endpoint was contacted
+            success = True
+            name = f"{name} (cached)"
+        else:
+            success, status, response = self.make_request('GET', endpoint)
+            if success:
+                self._connectivity_cache[endpoint] = time.monotonic()
+        self.log_test(name, success)
+        return success
+
     def test_health_check(self):
         """Test health check endpoint"""
-        success, status, response = self.make_request('GET', 'health')
-        self.log_test("Health Check", success and response.get('success', False))
-        return success
+        return self._connectivity_check("Health Check", 'health')
 
     def test_api_info(self):
         """Test API info endpoint"""
-        success, status, response = self.make_request('GET', '')
-        self.log_test("API Info", success and response.get('success', False))
-        return success
+        return self._connectivity_check("API Info", '')
 
     def test_user_registration(self):
         """Test user registration"""
-        timestamp = int(time.time())
+        timestamp = int(time.time() * 1000)
         test_data = {
             "name": "Test User",
             "email": f"testuser{timestamp}@example.com",
@@ -84,8 +275,10 @@ class CryptoHavenAPITester:
         
         success, status, response = self.make_request('POST', 'auth/register', test_data, expected_status=201)
         
-        if success and response.get('success'):
-            self.access_token = response.get('data', {}).get('accessToken')
+        if success:
+            self.test_email = test_data['email']
+            self.test_password = test_data['password']
+            self.set_access_token(response.get('data', {}).get('accessToken'))
             self.refresh_token = response.get('data', {}).get('refreshToken')
             self.user_id = response.get('data', {}).get('user', {}).get('id')
             self.log_test("User Registration", True)
@@ -95,17 +288,20 @@ class CryptoHavenAPITester:
             return False
 
     def test_user_login(self):
-        """Test user login"""
-        timestamp = int(time.time())
+        """Test user login with the account created by test_user_registration"""
+        if not self.test_email:
+            self.log_test("User Login", False, "No registered user available")
+            return False
+            
         login_data = {
-            "email": f"testuser{timestamp}@example.com",
-            "password": "TestPassword123!"
+            "email": self.test_email,
+            "password": self.test_password
         }
         
         success, status, response = self.make_request('POST', 'auth/login', login_data)
         
-        if success and response.get('success'):
-            self.access_token = response.get('data', {}).get('accessToken')
+        if success:
+            self.set_access_token(response.get('data', {}).get('accessToken'))
             self.refresh_token = response.get('data', {}).get('refreshToken')
             self.log_test("User Login", True)
             return True
@@ -114,16 +310,23 @@ class CryptoHavenAPITester:
             return False
 
     def test_admin_login(self):
-        """Test admin login"""
-        admin_data = {
-            "email": "admin@cryptohaven.com",
-            "password": "SecureAdminPassword123!"
-        }
+        """Test admin login, reusing a cached token while the server still accepts it"""
+        cached_token = self.load_cached_token('admin_token')
+        if cached_token:
+            success, status, response = self.make_request('GET', 'auth/profile',
+                                                          headers=self._bearer_headers(cached_token)[0])
+            if success:
+                self.set_admin_token(cached_token)
+                self.log_test("Admin Login", True)
+                return True
+            if status == 401:
+                self.store_cached_token('admin_token', None)
         
-        success, status, response = self.make_request('POST', 'auth/login', admin_data)
+        success, status, response = self.make_request('POST', 'auth/login', raw_body=self.PRE_ENCODED['admin_login'])
         
-        if success and response.get('success'):
-            self.admin_token = response.get('data', {}).get('accessToken')
+        if success:
+            self.set_admin_token(response.get('data', {}).get('accessToken'))
+            self.store_cached_token('admin_token', self.admin_token)
             self.log_test("Admin Login", True)
             return True
         else:
@@ -132,7 +335,7 @@ class CryptoHavenAPITester:
 
     def test_protected_endpoint_without_token(self):
         """Test accessing protected endpoint without token"""
-        success, status, response = self.make_request('GET', 'auth/profile', expected_status=401)
+        success, status, response = self.make_request('GET', 'auth/profile', expected_status=401, require_success_flag=False)
         self.log_test("Protected Endpoint Without Token", success)
         return success
 
@@ -142,8 +345,8 @@ class CryptoHavenAPITester:
             self.log_test("User Profile", False, "No access token available")
             return False
             
-        success, status, response = self.make_request('GET', 'auth/profile', token=self.access_token)
-        self.log_test("User Profile", success and response.get('success', False))
+        success, status, response = self.make_request('GET', 'auth/profile', headers=self._user_headers)
+        self.log_test("User Profile", success)
         return success
 
     def test_deposit_addresses(self):
@@ -152,8 +355,8 @@ class CryptoHavenAPITester:
             self.log_test("Deposit Addresses", False, "No access token available")
             return False
             
-        success, status, response = self.make_request('GET', 'deposits/addresses', token=self.access_token)
-        self.log_test("Deposit Addresses", success and response.get('success', False))
+        success, status, response = self.make_request('GET', 'deposits/addresses', headers=self._user_headers)
+        self.log_test("Deposit Addresses", success)
         return success
 
     def test_create_deposit(self):
@@ -162,15 +365,8 @@ class CryptoHavenAPITester:
             self.log_test("Create Deposit", False, "No access token available")
             return False
             
-        deposit_data = {
-            "txid": "0xtest123456789",  # Made longer to meet minimum requirement
-            "chain": "ERC20",
-            "amount_usd": 100,
-            "coin": "USDT"
-        }
-        
-        success, status, response = self.make_request('POST', 'deposits', deposit_data, token=self.access_token, expected_status=201)
-        self.log_test("Create Deposit", success and response.get('success', False))
+        success, status, response = self.make_request('POST', 'deposits', headers=self._user_json_headers, expected_status=201, raw_body=self.PRE_ENCODED['deposit'])
+        self.log_test("Create Deposit", success)
         return success
 
     def test_deposit_history(self):
@@ -179,8 +375,8 @@ class CryptoHavenAPITester:
             self.log_test("Deposit History", False, "No access token available")
             return False
             
-        success, status, response = self.make_request('GET', 'deposits', token=self.access_token)
-        self.log_test("Deposit History", success and response.get('success', False))
+        success, status, response = self.make_request('GET', 'deposits', headers=self._user_headers)
+        self.log_test("Deposit History", success)
         return success
 
     def test_investment_plans(self):
@@ -189,8 +385,8 @@ class CryptoHavenAPITester:
             self.log_test("Investment Plans", False, "No access token available")
             return False
             
-        success, status, response = self.make_request('GET', 'investments/plans', token=self.access_token)
-        self.log_test("Investment Plans", success and response.get('success', False))
+        success, status, response = self.make_request('GET', 'investments/plans', headers=self._user_headers)
+        self.log_test("Investment Plans", success)
         return success
 
     def test_create_investment(self):
@@ -199,12 +395,7 @@ class CryptoHavenAPITester:
             self.log_test("Create Investment", False, "No access token available")
             return False
             
-        investment_data = {
-            "plan_id": "1",  # Fixed field name
-            "amount_usd": 50  # Fixed field name
-        }
-        
-        success, status, response = self.make_request('POST', 'investments', investment_data, token=self.access_token, expected_status=400)
+        success, status, response = self.make_request('POST', 'investments', headers=self._user_json_headers, expected_status=400, raw_body=self.PRE_ENCODED['investment'], require_success_flag=False)
         # This should fail due to insufficient balance, so we expect a 400 status
         self.log_test("Create Investment (Expected Failure)", success)
         return success
@@ -215,8 +406,8 @@ class CryptoHavenAPITester:
             self.log_test("Admin Dashboard Stats", False, "No admin token available")
             return False
             
-        success, status, response = self.make_request('GET', 'admin/dashboard', token=self.admin_token)
-        self.log_test("Admin Dashboard Stats", success and response.get('success', False))
+        success, status, response = self.make_request('GET', 'admin/dashboard', headers=self._admin_headers)
+        self.log_test("Admin Dashboard Stats", success)
         return success
 
     def test_admin_all_deposits(self):
@@ -225,8 +416,8 @@ class CryptoHavenAPITester:
             self.log_test("Admin All Deposits", False, "No admin token available")
             return False
             
-        success, status, response = self.make_request('GET', 'admin/deposits', token=self.admin_token)
-        self.log_test("Admin All Deposits", success and response.get('success', False))
+        success, status, response = self.make_request('GET', 'admin/deposits', headers=self._admin_headers)
+        self.log_test("Admin All Deposits", success)
         return success
 
     def test_token_refresh(self):
@@ -238,8 +429,8 @@ class CryptoHavenAPITester:
         refresh_data = {"refreshToken": self.refresh_token}
         success, status, response = self.make_request('POST', 'auth/refresh', refresh_data)
         
-        if success and response.get('success'):
-            self.access_token = response.get('data', {}).get('accessToken')
+        if success:
+            self.set_access_token(response.get('data', {}).get('accessToken'))
             self.log_test("Token Refresh", True)
             return True
         else:
@@ -248,81 +439,174 @@ class CryptoHavenAPITester:
 
     def test_invalid_login(self):
         """Test login with invalid credentials"""
-        invalid_data = {
-            "email": "invalid@example.com",
-            "password": "wrongpassword"
-        }
-        
-        success, status, response = self.make_request('POST', 'auth/login', invalid_data, expected_status=401)
+        success, status, response = self.make_request('POST', 'auth/login', expected_status=401, raw_body=self.PRE_ENCODED['invalid_login'], require_success_flag=False)
         self.log_test("Invalid Login", success)
         return success
 
     def test_duplicate_registration(self):
-        """Test duplicate user registration"""
-        timestamp = int(time.time())
+        """Test registering the already registered test user again"""
+        if not self.test_email:
+            self.log_test("Duplicate Registration", False, "No registered user available")
+            return False
+            
         duplicate_data = {
             "name": "Test User",
-            "email": f"testuser{timestamp}@example.com",
-            "password": "TestPassword123!"
+            "email": self.test_email,
+            "password": self.test_password
         }
         
-        success, status, response = self.make_request('POST', 'auth/register', duplicate_data, expected_status=400)
+        success, status, response = self.make_request('POST', 'auth/register', duplicate_data, expected_status=400, require_success_flag=False)
         self.log_test("Duplicate Registration", success)
         return success
 
+    def run_concurrently(self, *tests):
+        """Run independent tests in parallel over the shared session
+
+        Results are recorded in submission order, so output stays stable
+        regardless of which test finishes first.
+        """
+        with ThreadPoolExecutor(max_workers=min(len(tests), self.MAX_CONCURRENCY)) as executor:
+            futures = [executor.submit(self._run_pending, test) for test in tests]
+            outcomes = [future.result() for future in futures]
+        
+        for _, pending in outcomes:
+            for name, success, details in pending:
+                self._record_result(name, success, details)
+        return [result for result, _ in outcomes]
+
+    def _run_pending(self, test):
+        """Run a test on a worker thread, collecting its results instead of recording them"""
+        self._local.pending = []
+        try:
+            return test(), self._local.pending
+        finally:
+            self._local.pending = None
+
+    def close(self):
+        """Release pooled connections of the session this tester built"""
+        if self._owns_session:
+            self.session.close()
+
     def run_all_tests(self):
         """Run all tests in sequence"""
+        # Per-run auth state is cleared so a failed registration or login in a
+        # looped run can't be masked by the previous run's user and tokens
+        self.set_access_token(None)
+        self.refresh_token = None
+        self.user_id = None
+        self.test_email = None
+        self.test_password = None
+        self.set_admin_token(None)
+        first_run = self._runs_started == 0
+        self._runs_started += 1
+        self.tests_run = 0
+        self.tests_passed = 0
+        self._names = []
+        self._passed = bytearray()
+        self._failure_details = {}
+        started = time.perf_counter()
+        
         print("🚀 Starting CryptoHaven Backend API Tests")
         print("=" * 50)
         
-        # Basic connectivity tests
-        self.test_health_check()
-        self.test_api_info()
-        
-        # Authentication tests
-        self.test_user_registration()
-        self.test_user_login()
-        self.test_admin_login()
-        
-        # Security tests
-        self.test_protected_endpoint_without_token()
-        self.test_invalid_login()
-        self.test_duplicate_registration()
-        
-        # User functionality tests
-        self.test_user_profile()
-        self.test_deposit_addresses()
-        self.test_create_deposit()
-        self.test_deposit_history()
-        self.test_investment_plans()
-        self.test_create_investment()
-        
-        # Admin functionality tests
-        self.test_admin_dashboard_stats()
-        self.test_admin_all_deposits()
-        
-        # Token management tests
-        self.test_token_refresh()
+        try:
+            # Tests are grouped by data dependency: each stage relies on tokens
+            # set by the previous one, tests within a group are independent.
+            
+            # Basic connectivity tests
+            self.run_concurrently(self.test_health_check, self.test_api_info)
+            
+            # Authentication tests
+            self.test_user_registration()
+            self.test_user_login()
+            self.test_admin_login()
+            
+            # Security tests. Invalid login and duplicate registration count as
+            # failed attempts against the backend's authLimiter (5 per 15 minutes),
+            # so only the first run of a loop makes them.
+            security_tests = [self.test_protected_endpoint_without_token]
+            if first_run:
+                security_tests += [self.test_invalid_login, self.test_duplicate_registration]
+            self.run_concurrently(*security_tests)
+            
+            # User functionality tests. Creating deposits and investments counts
+            # against the backend's financialLimiter (10 per 5 minutes, successes
+            # included), so only the first run of a loop makes them.
+            self.test_user_profile()
+            if first_run:
+                self.test_create_deposit()
+            self.run_concurrently(
+                self.test_deposit_addresses,
+                self.test_deposit_history,
+                self.test_investment_plans,
+            )
+            if first_run:
+                self.test_create_investment()
+            
+            # Admin functionality tests
+            self.run_concurrently(self.test_admin_dashboard_stats, self.test_admin_all_deposits)
+            
+            # Token management tests
+            self.test_token_refresh()
+        finally:
+            self.flush_log()
         
         # Print summary
         print("\n" + "=" * 50)
-        print(f"📊 Test Summary: {self.tests_passed}/{self.tests_run} tests passed")
+        print(f"📊 Test Summary: {self.tests_passed}/{self.tests_run} tests passed "
+              f"in {time.perf_counter() - started:.2f}s")
         
         if self.tests_passed == self.tests_run:
             print("🎉 All tests passed!")
             return 0
         else:
             print("❌ Some tests failed. Check the details above.")
-            failed_tests = [test for test in self.test_results if not test['success']]
             print("\nFailed Tests:")
-            for test in failed_tests:
-                print(f"  - {test['name']}: {test['details']}")
+            for index, (name, passed) in enumerate(zip(self._names, self._passed)):
+                if not passed:
+                    print(f"  - {name}: {self._failure_details[index]}")
             return 1
 
+def positive_int(value):
+    """argparse type for integers >= 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def non_negative_float(value):
+    """argparse type for floats >= 0"""
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return number
+
 def main():
     """Main test runner"""
+    parser = argparse.ArgumentParser(description="CryptoHaven Backend API Testing Suite")
+    parser.add_argument('--loop', type=positive_int, default=1, metavar='N',
+                        help="run the suite N times in one process (default: 1). "
+                             "Invalid login, duplicate registration, create deposit and "
+                             "create investment only run on the first iteration, to stay "
+                             "under the backend's auth (5 failures per 15 minutes) and "
+                             "financial (10 requests per 5 minutes) rate limits. The "
+                             "general limit of 100 requests per 15 minutes on /api/ "
+                             "still allows only about 7 back-to-back runs per window")
+    parser.add_argument('--interval', type=non_negative_float, default=0.0, metavar='SECONDS',
+                        help="pause between looped runs (default: 0)")
+    args = parser.parse_args()
+    
     tester = CryptoHavenAPITester()
-    return tester.run_all_tests()
+    exit_code = 0
+    try:
+        for run in range(args.loop):
+            if run:
+                time.sleep(args.interval)
+                print()
+            exit_code |= tester.run_all_tests()
+    finally:
+        tester.close()
+    return exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file